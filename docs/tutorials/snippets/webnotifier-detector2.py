@@ -1,6 +1,7 @@
 # isort: off
 from __future__ import annotations
 
+import hashlib
 import logging
 from dataclasses import dataclass
 from typing import Any
@@ -28,20 +29,28 @@ class Detector:
 
     async def run(self) -> None:
         async with httpx.AsyncClient() as http:
-            last_modified, old_lines = None, None
+            etag, last_modified, old_digest, old_lines = None, None, None, None
             while True:
                 logger.debug("Fetching contents of %s", self.url)
-                headers: dict[str, Any] = (
-                    {"if-modified-since": last_modified} if last_modified else {}
-                )
-                response = await http.get("https://imgur.com", headers=headers)
+                headers: dict[str, Any] = {}
+                if etag:
+                    headers["if-none-match"] = etag
+                if last_modified:
+                    headers["if-modified-since"] = last_modified
+
+                response = await http.get(self.url, headers=headers)
                 logger.debug("Response status: %d", response.status_code)
                 if response.status_code == 200:
+                    etag = response.headers.get("etag")
                     last_modified = response.headers["date"]
-                    new_lines = response.text.split("\n")
-                    if old_lines is not None and old_lines != new_lines:
-                        self.changed.dispatch(WebPageChangeEvent(old_lines, new_lines))
-
-                    old_lines = new_lines
+                    new_digest = hashlib.blake2b(response.content).digest()
+                    if new_digest != old_digest:
+                        new_lines = response.text.split("\n")
+                        if old_lines is not None:
+                            self.changed.dispatch(
+                                WebPageChangeEvent(old_lines, new_lines)
+                            )
+
+                        old_digest, old_lines = new_digest, new_lines
 
                 await anyio.sleep(self.delay)
@@ -13,6 +13,8 @@ from yaml import Loader, ScalarNode
 from ._runner import run_application
 from ._utils import merge_config, qualified_name
 
+dotted_key_re = re.compile(r"(?<!\\)\.")
+
 
 def env_constructor(loader: Loader, node: ScalarNode) -> str | None:
     return os.getenv(node.value)
@@ -79,7 +81,7 @@ def run(configfile: Sequence[str], service: str | None, set_: list[str]) -> None
 
         key, value = override.split("=", 1)
         parsed_value = yaml.load(value, AsphaltLoader)
-        keys = [k.replace(r"\.", ".") for k in re.split(r"(?<!\\)\.", key)]
+        keys = [k.replace(r"\.", ".") for k in dotted_key_re.split(key)]
         section = config
         for i, part_key in enumerate(keys[:-1]):
             section = section.setdefault(part_key, {})
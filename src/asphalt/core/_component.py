@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import gc
 import logging
-from abc import ABCMeta, abstractmethod
 from collections.abc import (
     Awaitable,
     Coroutine,
@@ -11,6 +11,7 @@ from collections.abc import (
 )
 from contextlib import AsyncExitStack
 from enum import Enum, auto
+from functools import partial
 from inspect import isclass
 from traceback import StackSummary
 from types import FrameType
@@ -31,9 +32,10 @@ from ._concurrent import ExceptionHandler, TaskFactory, TeardownAction
 from ._context import (
     Context,
     FactoryCallback,
+    ResourceEvent,
     T_Resource,
     TeardownCallback,
-    current_context,
+    _current_context,
 )
 from ._exceptions import ComponentStartError, NoCurrentContext, ResourceNotFound
 from ._utils import (
@@ -50,7 +52,7 @@ TComponent = TypeVar("TComponent", bound="Component")
 T_Retval = TypeVar("T_Retval")
 
 
-class Component(metaclass=ABCMeta):
+class Component:
     """This is the base class for all Asphalt components."""
 
     _isolated: ClassVar[bool]
@@ -105,7 +107,11 @@ class Component(metaclass=ABCMeta):
         elif alias in self._child_components:
             raise ValueError(f'there is already a child component named "{alias}"')
 
-        self._child_components[alias] = {"type": type or alias, **config}
+        entry: dict[str, Any] = {"type": type or alias}
+        if config:
+            entry.update(config)
+
+        self._child_components[alias] = entry
 
     async def prepare(self) -> None:
         """
@@ -151,7 +157,6 @@ class CLIApplicationComponent(Component):
     it is set to 1 and a warning is emitted.
     """
 
-    @abstractmethod
     async def run(self) -> int | None:
         """
         Run the business logic of the command line tool.
@@ -160,6 +165,7 @@ class CLIApplicationComponent(Component):
 
         :return: the application's exit code (0-127; ``None`` = 0)
         """
+        raise NotImplementedError
 
 
 component_types = PluginContainer("asphalt.components", Component)
@@ -175,6 +181,16 @@ class ComponentState(Enum):
 
 
 class ComponentContext(Context):
+    __slots__ = (
+        "_child_component_contexts",
+        "_component",
+        "_component_state",
+        "_context",
+        "_coro",
+        "_default_resource_name",
+        "path",
+    )
+
     def __init__(
         self,
         component: Component,
@@ -189,11 +205,17 @@ class ComponentContext(Context):
         self._child_component_contexts = child_component_contexts
         self._component_state: ComponentState = ComponentState.initialized
         self._coro: Coroutine[Any, Any, None] | None = None
-        context = current_context()
-        if isinstance(context, ComponentContext):
-            context = context._context
+        # Context.__init__() has already resolved the nearest non-component context
+        if self._parent is None:
+            raise NoCurrentContext
 
-        self._context: Context = context
+        self._context: Context = self._parent
+
+    def _inherit_resources(self, parent: Context) -> None:
+        # All resource operations are delegated to the parent context, so there's no
+        # point in copying its resource maps
+        self._resources = {}
+        self._resource_factories = {}
 
     @staticmethod
     def _format_resource_description(
@@ -230,11 +252,14 @@ class ComponentContext(Context):
             description=description,
             teardown_callback=teardown_callback,
         )
-        logger.debug(
-            "%s added a resource (%s)",
-            format_component_name(self.path, capitalize=True),
-            self._format_resource_description(types or type(value), name, description),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s added a resource (%s)",
+                format_component_name(self.path, capitalize=True),
+                self._format_resource_description(
+                    types or type(value), name, description
+                ),
+            )
 
     def add_resource_factory(
         self,
@@ -250,13 +275,16 @@ class ComponentContext(Context):
         self._context.add_resource_factory(
             factory_callback, name, types=types, description=description
         )
-        logger.debug(
-            "%s added a resource factory (%s)",
-            format_component_name(self.path, capitalize=True),
-            self._format_resource_description(
-                types or get_type_hints(factory_callback)["return"], name, description
-            ),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s added a resource factory (%s)",
+                format_component_name(self.path, capitalize=True),
+                self._format_resource_description(
+                    types or get_type_hints(factory_callback)["return"],
+                    name,
+                    description,
+                ),
+            )
 
     @overload
     async def get_resource(
@@ -302,8 +330,7 @@ class ComponentContext(Context):
 
             # Wait until a matching resource or resource factory is available
             await self._context.resource_added.wait_event(
-                lambda event: event.resource_name == name
-                and type in event.resource_types,
+                partial(_is_matching_resource_event, type, name)
             )
             res = await self._context.get_resource(type, name)
             logger.debug(
@@ -378,10 +405,14 @@ class ComponentContext(Context):
         return retval
 
 
+def _is_matching_resource_event(type: type, name: str, event: ResourceEvent) -> bool:
+    return event.resource_name == name and type in event.resource_types
+
+
 @overload
 async def start_component(
     component_class: type[TComponent],
-    config: dict[str, Any] | None = ...,
+    config: MutableMapping[str, Any] | None = ...,
     *,
     timeout: float | None = ...,
 ) -> TComponent: ...
@@ -390,7 +421,7 @@ async def start_component(
 @overload
 async def start_component(
     component_class: str,
-    config: dict[str, Any] | None = ...,
+    config: MutableMapping[str, Any] | None = ...,
     *,
     timeout: float | None = ...,
 ) -> Component: ...
@@ -398,7 +429,7 @@ async def start_component(
 
 async def start_component(
     component_class: type[Component] | str,
-    config: dict[str, Any] | None = None,
+    config: MutableMapping[str, Any] | None = None,
     *,
     timeout: float | None = 20,
 ) -> Component:
@@ -417,19 +448,15 @@ async def start_component(
         or a string
 
     """
-    try:
-        current_context()
-    except NoCurrentContext:
-        raise RuntimeError(
-            "start_component() requires an active Asphalt context"
-        ) from None
+    if _current_context.get() is None:
+        raise RuntimeError("start_component() requires an active Asphalt context")
 
     if config is None:
         config = {}
     elif not isinstance(config, MutableMapping):
         raise TypeError("config must be a dict (or any other mutable mapping) or None")
 
-    root_component_context = _init_component("", {"type": component_class, **config})
+    root_component_context = _init_component({"type": component_class, **config})
     async with AsyncExitStack() as exit_stack:
         tg: TaskGroup | None = None
         if timeout:
@@ -449,67 +476,97 @@ async def start_component(
     return root_component_context._component
 
 
-def _init_component(
-    path: str,
-    config: MutableMapping[str, Any],
-    default_resource_name: str = "default",
-) -> ComponentContext:
-    # Separate the child components from the config
-    child_components_config = config.pop("components", {})
-
-    # Resolve the type to a class
-    component_type = config.pop("type")
-    component_class = component_types.resolve(component_type)
-    if not isclass(component_class) or not issubclass(component_class, Component):
-        raise TypeError(
-            f"{path or '(root)'}: the declared component type ({component_type!r}) "
-            f"resolved to {component_class!r} which is not a subclass of Component"
-        )
+def _init_component(config: MutableMapping[str, Any]) -> ComponentContext:
+    root_context: ComponentContext | None = None
+    resolved_classes: dict[str, type[Component]] = {}
 
-    # Instantiate the component
-    logger.debug("Creating %s", format_component_name(path, component_class))
-    try:
-        component = component_class(**config)
-    except Exception as exc:
-        raise ComponentStartError("creating", path, component_class) from exc
-
-    # Merge the overrides to the hard-coded configuration
-    logger.debug("Created %s", format_component_name(path, component_class))
-    child_components_config = merge_config(
-        component._child_components, child_components_config
-    )
-
-    # Create the child components
-    child_contexts: dict[str, ComponentContext] = {}
-    for alias, child_config in child_components_config.items():
-        child_path = f"{path}.{alias}" if path else alias
-
-        if child_config is None:
-            child_config = {}
-        elif not isinstance(child_config, MutableMapping):
-            raise TypeError(
-                f"{child_path}: component configuration must be either None or a "
-                f"dict (or any other mutable mapping type), not "
-                f"{qualified_name(child_config)}"
+    # Walk the component tree depth first, in configuration order, using a stack of
+    # (path, alias, configuration, child contexts of the parent) tuples
+    stack: list[tuple[str, str | None, Any, dict[str, ComponentContext] | None]] = [
+        ("", None, config, None)
+    ]
+    while stack:
+        path, alias, config, parent_child_contexts = stack.pop()
+        default_resource_name = "default"
+        if alias is not None:
+            if config is None:
+                config = {}
+            elif not isinstance(config, MutableMapping):
+                raise TypeError(
+                    f"{path}: component configuration must be either None or a "
+                    f"dict (or any other mutable mapping type), not "
+                    f"{qualified_name(config)}"
+                )
+
+            # If the type was specified only via an alias, use that as a type
+            component_type = config.setdefault("type", alias)
+
+            # If the type contains a forward slash, split the latter part out of it
+            if isinstance(component_type, str):
+                config["type"] = component_type.partition("/")[0]
+
+            _, sep, resource_name = alias.partition("/")
+            if sep:
+                default_resource_name = resource_name
+
+        # Separate the child components from the config
+        child_components_config = config.pop("components", {})
+
+        # Resolve the type to a class (each type name is only resolved once)
+        component_type = config.pop("type")
+        if isinstance(component_type, str) and component_type in resolved_classes:
+            component_class = resolved_classes[component_type]
+        else:
+            component_class = component_types.resolve(component_type)
+            if not isclass(component_class) or not issubclass(
+                component_class, Component
+            ):
+                raise TypeError(
+                    f"{path or '(root)'}: the declared component type "
+                    f"({component_type!r}) resolved to {component_class!r} which is "
+                    f"not a subclass of Component"
+                )
+
+            if isinstance(component_type, str):
+                resolved_classes[component_type] = component_class
+
+        # Instantiate the component
+        logger.debug("Creating %s", format_component_name(path, component_class))
+        try:
+            component = component_class(**config)
+        except Exception as exc:
+            raise ComponentStartError("creating", path, component_class) from exc
+
+        # Merge the overrides to the hard-coded configuration (skipping the merge when
+        # either side is empty, as is the case for most components)
+        logger.debug("Created %s", format_component_name(path, component_class))
+        if not component._child_components:
+            child_components_config = (
+                dict(child_components_config) if child_components_config else {}
+            )
+        elif child_components_config:
+            child_components_config = merge_config(
+                component._child_components, child_components_config
             )
-
-        # If the type was specified only via an alias, use that as a type
-        child_config.setdefault("type", alias)
-
-        # If the type contains a forward slash, split the latter part out of it
-        if isinstance(child_config["type"], str) and "/" in child_config["type"]:
-            child_config["type"] = child_config["type"].split("/")[0]
-
-        if "/" in alias:
-            child_default_resource_name = alias.split("/", 1)[1]
         else:
-            child_default_resource_name = "default"
+            child_components_config = component._child_components
 
-        child_contexts[child_path] = _init_component(
-            child_path, child_config, child_default_resource_name
+        child_contexts: dict[str, ComponentContext] = {}
+        context = ComponentContext(
+            component, path, default_resource_name, child_contexts
         )
+        if parent_child_contexts is None:
+            root_context = context
+        else:
+            parent_child_contexts[path] = context
+
+        # Push the children in reverse, so they get created in configuration order
+        for alias, child_config in reversed(child_components_config.items()):
+            child_path = f"{path}.{alias}" if path else alias
+            stack.append((child_path, alias, child_config, child_contexts))
 
-    return ComponentContext(component, path, default_resource_name, child_contexts)
+    assert root_context is not None
+    return root_context
 
 
 async def _start_component(context: ComponentContext) -> None:
@@ -538,14 +595,16 @@ async def _start_component(context: ComponentContext) -> None:
             context._coro = None
 
         # Start the child components, if there are any
-        if context._child_component_contexts:
+        if child_contexts := context._child_component_contexts:
             logger.debug(
                 "Starting the child components of %s",
                 format_component_name(context.path),
             )
             context._component_state = ComponentState.starting_children
+            # Each child is started in its own task, even if it's the only one, so
+            # that any context variables it sets won't leak to its parent
             async with coalesce_exceptions(), create_task_group() as tg:
-                for alias, child_context in context._child_component_contexts.items():
+                for child_context in child_contexts.values():
                     tg.start_soon(
                         _start_component,
                         child_context,
@@ -581,40 +640,34 @@ async def _watch_component_tree_startup(
     context: ComponentContext,
     timeout: float,
 ) -> None:
-    def create_status_summaries(subcontext: ComponentContext) -> list[str]:
+    def create_summaries(subcontext: ComponentContext) -> None:
         parts = (subcontext.path or "(root)").split(".")
         indent = "  " * (len(parts) if subcontext.path else 0)
         state = subcontext._component_state.name.replace("_", " ")
-        summaries = [f"{indent}{parts[-1]}: {state}"]
-        for child_context in subcontext._child_component_contexts.values():
-            if child_context._component_state is not ComponentState.started:
-                summaries.extend(create_status_summaries(child_context))
-
-        return summaries
-
-    def create_stack_summaries(subcontext: ComponentContext) -> list[str]:
-        summaries: list[str] = []
+        status_summaries.append(f"{indent}{parts[-1]}: {state}")
         if subcontext._coro is not None:
             stack_summary = _get_coro_stack_summary(subcontext._coro)
             formatted_summary = "".join(stack_summary.format())
             title = f"{subcontext.path} ({qualified_name(subcontext._component)})"
-            summaries.append(f"{title}:\n{formatted_summary.rstrip()}")
+            stack_summaries.append(f"{title}:\n{formatted_summary.rstrip()}")
 
+        # Components that have finished starting can't have any pending children
         for child_context in subcontext._child_component_contexts.values():
-            summaries.extend(create_stack_summaries(child_context))
-
-        return summaries
+            if child_context._component_state is not ComponentState.started:
+                create_summaries(child_context)
 
     await sleep(timeout)
     status_summary_sections: list[str] = [
         "Timeout waiting for the component tree to start"
     ]
-    status_summaries: list[str] = create_status_summaries(context)
+    status_summaries: list[str] = []
+    stack_summaries: list[str] = []
+    create_summaries(context)
     title = "Current status of the components still waiting to finish startup"
     status_summary_sections.append(f"{title}\n{'-' * len(title)}")
     status_summary_sections.append("\n".join(status_summaries))
 
-    if stack_summaries := create_stack_summaries(context):
+    if stack_summaries:
         title = "Stack summaries of components still waiting to start"
         status_summary_sections.append(f"{title}\n{'-' * len(title)}")
         status_summary_sections.extend(stack_summaries)
@@ -624,8 +677,6 @@ async def _watch_component_tree_startup(
 
 
 def _get_coro_stack_summary(coro: Coroutine[Any, Any, Any]) -> StackSummary:
-    import gc
-
     frames: list[FrameType] = []
     awaitable: Awaitable[Any] | None = coro
     while isinstance(awaitable, Coroutine):
@@ -638,5 +689,6 @@ def _get_coro_stack_summary(coro: Coroutine[Any, Any, Any]) -> StackSummary:
 
         awaitable = getattr(awaitable, "cr_await", None)
 
+    # Source lines are looked up lazily when the summary is formatted
     frame_tuples = [(f, f.f_lineno) for f in frames]
-    return StackSummary.extract(frame_tuples)
+    return StackSummary.extract(frame_tuples, lookup_lines=False)
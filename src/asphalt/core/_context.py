@@ -3,7 +3,6 @@ from __future__ import annotations
 import logging
 import re
 import sys
-import types
 import warnings
 from collections.abc import (
     AsyncGenerator,
@@ -12,10 +11,10 @@ from collections.abc import (
     Sequence,
 )
 from contextlib import AsyncExitStack
-from contextvars import ContextVar, Token
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from inspect import (
     Parameter,
     isasyncgenfunction,
@@ -63,6 +62,7 @@ from ._exceptions import (
 from ._utils import callable_name, coalesce_exceptions, qualified_name
 
 if sys.version_info >= (3, 10):
+    from types import UnionType
     from typing import ParamSpec, TypeAlias
 else:
     from typing_extensions import ParamSpec, TypeAlias
@@ -146,6 +146,13 @@ class ResourceEvent(Event):
     is_factory: bool
 
 
+@lru_cache(maxsize=256)
+def _is_valid_resource_name(name: str) -> bool:
+    # Resource names in an application tend to come from a small, fixed set, so the
+    # results of the regular expression match are cached
+    return resource_name_re.fullmatch(name) is not None
+
+
 class ContextState(Enum):
     inactive = auto()
     open = auto()
@@ -165,12 +172,27 @@ class Context:
         resource has been published in this context
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_child_contexts",
+        "_exit_stack",
+        "_inheritable_resources",
+        "_parent",
+        "_resource_factories",
+        "_resources",
+        "_resources_by_type",
+        "_state",
+        "_task_group",
+        "_teardown_callbacks",
+    )
+
     resource_added: Signal[ResourceEvent] = Signal(ResourceEvent)
 
     _resources: dict[tuple[type, str], ResourceContainer]
+    _inheritable_resources: dict[tuple[type, str], ResourceContainer] | None
+    _resources_by_type: dict[type, dict[str, Any]] | None
     _resource_factories: dict[tuple[type, str], ResourceFactory]
     _task_group: TaskGroup
-    _reset_token: Token[Context]
     _exit_stack: AsyncExitStack
 
     def __init__(self, parent: Context | None = None) -> None:
@@ -180,28 +202,34 @@ class Context:
 
         """
         self._state = ContextState.inactive
-        self._teardown_callbacks: list[tuple[TeardownCallback, bool]] = []
+        self._teardown_callbacks: list[tuple[Callable[..., Any], bool]] = []
         self._child_contexts = set[Context]()
-        self._parent = parent or _current_context.get(None)
-
-        if self._parent is not None:
-            from ._component import ComponentContext
-
-            # Don't set a ComponentContext as parent as they exit sooner
-            while isinstance(self._parent, ComponentContext):
-                self._parent = self._parent._context
-
-            self._resources = {
-                key: res
-                for key, res in self._parent._resources.items()
-                if not res.is_generated
-            }
-            self._resource_factories = self._parent._resource_factories.copy()
-            self._task_group = self._parent._task_group
+        self._inheritable_resources = None
+        self._resources_by_type = None
+        if parent is None:
+            parent = _current_context.get()
+
+        if parent is not None:
+            # Don't set a ComponentContext as parent as they exit sooner (the import is
+            # skipped for plain contexts, as those are by far the most common parents)
+            if type(parent) is not Context:
+                from ._component import ComponentContext
+
+                while isinstance(parent, ComponentContext):
+                    parent = parent._context
+
+            self._inherit_resources(parent)
+            self._task_group = parent._task_group
         else:
             self._resources = {}
             self._resource_factories = {}
 
+        self._parent = parent
+
+    def _inherit_resources(self, parent: Context) -> None:
+        self._resources = parent._get_inheritable_resources().copy()
+        self._resource_factories = parent._resource_factories.copy()
+
     @property
     def parent(self) -> Context | None:
         """Return the parent context, or ``None`` if there is no parent."""
@@ -216,6 +244,46 @@ class Context:
         """
         return self._state in (ContextState.closing, ContextState.closed)
 
+    def _get_inheritable_resources(self) -> dict[tuple[type, str], ResourceContainer]:
+        # The filtered mapping is cached until the next resource is added, so that
+        # creating child contexts doesn't require a full scan of the resources each time
+        if self._inheritable_resources is None:
+            self._inheritable_resources = {
+                key: res for key, res in self._resources.items() if not res.is_generated
+            }
+
+        return self._inheritable_resources
+
+    def _dispatch_resource_added(
+        self,
+        types: tuple[type, ...],
+        name: str,
+        description: str | None,
+        is_factory: bool,
+    ) -> None:
+        # Resources are mostly added when nobody is listening, so skip creating the
+        # event altogether in that case
+        signal = self.resource_added
+        if signal._has_listeners():
+            signal.dispatch(ResourceEvent(types, name, description, is_factory))
+
+    def _add_generated_resource(self, factory: ResourceFactory, value: Any) -> None:
+        # The name and types were already validated when the factory was added, so the
+        # checks in add_resource() are skipped here
+        container = ResourceContainer(
+            value, factory.types, factory.name, factory.description, is_generated=True
+        )
+        for type_ in factory.types:
+            self._resources[(type_, factory.name)] = container
+
+        # Generated resources are never inherited, so only the type index is stale
+        self._resources_by_type = None
+
+        # Dispatch the resource_added event to notify any listeners
+        self._dispatch_resource_added(
+            factory.types, factory.name, factory.description, False
+        )
+
     def _ensure_state(self, *allowed_states: ContextState) -> None:
         if self._state in allowed_states:
             return
@@ -233,17 +301,15 @@ class Context:
     async def _run_teardown_callbacks(self) -> None:
         original_exception = sys.exc_info()[1]
         exceptions: list[BaseException] = []
-        while self._teardown_callbacks:
-            callback, pass_exception = self._teardown_callbacks.pop()
+        teardown_callbacks = self._teardown_callbacks
+        while teardown_callbacks:
+            # Callbacks may still be added while the context is being torn down, so
+            # they're popped one at a time rather than iterated over
+            callback, pass_exception = teardown_callbacks.pop()
             try:
-                if pass_exception:
-                    retval = cast(Callable[[Optional[BaseException]], Any], callback)(
-                        original_exception
-                    )
-                else:
-                    retval = cast(Callable[[], Any], callback)()
-
-                if isawaitable(retval):
+                retval = callback(original_exception) if pass_exception else callback()
+                # Most synchronous callbacks return None, so skip the ABC checks then
+                if retval is not None and isawaitable(retval):
                     await retval
             except BaseException as e:
                 exceptions.append(e)
@@ -274,7 +340,9 @@ class Context:
             this context (or ``None`` if the context ended cleanly)
 
         """
-        self._ensure_state(ContextState.open, ContextState.closing)
+        if self._state is not ContextState.open:
+            self._ensure_state(ContextState.open, ContextState.closing)
+
         if not callable(callback):
             raise TypeError("callback must be a callable")
 
@@ -374,7 +442,7 @@ class Context:
         if value is None:
             raise ValueError('"value" must not be None')
 
-        if not resource_name_re.fullmatch(name):
+        if not _is_valid_resource_name(name):
             raise ValueError(
                 '"name" must be a nonempty string consisting only of alphanumeric '
                 "characters and underscores"
@@ -391,12 +459,14 @@ class Context:
         for type_ in types_:
             self._resources[(type_, name)] = container
 
+        self._inheritable_resources = self._resources_by_type = None
+
         # Add the teardown callback, if any
         if teardown_callback is not None:
             self.add_teardown_callback(teardown_callback)
 
         # Notify listeners that a new resource has been made available
-        self.resource_added.dispatch(ResourceEvent(types_, name, description, False))
+        self._dispatch_resource_added(types_, name, description, False)
 
     def add_resource_factory(
         self,
@@ -437,10 +507,8 @@ class Context:
             type/name combinations or the given context variable
 
         """
-        import types as stdlib_types
-
         self._ensure_state(ContextState.open)
-        if not resource_name_re.fullmatch(name):
+        if not _is_valid_resource_name(name):
             raise ValueError(
                 '"name" must be a nonempty string consisting only of alphanumeric '
                 "characters and underscores"
@@ -463,9 +531,7 @@ class Context:
                 ) from None
 
             origin = get_origin(return_type_hint)
-            if origin is Union or (
-                sys.version_info >= (3, 10) and origin is stdlib_types.UnionType
-            ):
+            if origin is Union or (sys.version_info >= (3, 10) and origin is UnionType):
                 resource_types = get_args(return_type_hint)
             else:
                 resource_types = (return_type_hint,)
@@ -487,9 +553,7 @@ class Context:
             self._resource_factories[(type_, name)] = resource
 
         # Notify listeners that a new resource has been made available
-        self.resource_added.dispatch(
-            ResourceEvent(resource_types, name, description, True)
-        )
+        self._dispatch_resource_added(resource_types, name, description, True)
 
     @overload
     def get_resource_nowait(
@@ -525,18 +589,18 @@ class Context:
             ``optional`` was ``False``
 
         """
-        self._ensure_state(ContextState.open, ContextState.closing)
-        key = (type, name)
+        # The state check is skipped in the common case of an open context
+        if self._state is not ContextState.open:
+            self._ensure_state(ContextState.open, ContextState.closing)
 
         # First check if there's already a matching resource in this context
-        resource = self._resources.get(key)
-        if resource is not None:
+        key = (type, name)
+        if (resource := self._resources.get(key)) is not None:
             return cast(T_Resource, resource.value)
 
         # Next, check if there's a resource factory for this type
-        if key in self._resource_factories:
+        if (factory := self._resource_factories.get(key)) is not None:
             # Call the factory callback to generate the resource
-            factory = self._resource_factories[key]
             generated_resource = factory.callback()
 
             # Raise AsyncResourceError if the factory returns a coroutine object
@@ -545,21 +609,7 @@ class Context:
                 raise AsyncResourceError()
 
             # Store the generated resource in the context
-            container = ResourceContainer(
-                generated_resource,
-                factory.types,
-                factory.name,
-                factory.description,
-                is_generated=True,
-            )
-            for type_ in factory.types:
-                self._resources[(type_, factory.name)] = container
-
-            # Dispatch the resource_added event to notify any listeners
-            self.resource_added.dispatch(
-                ResourceEvent(factory.types, name, factory.description, False)
-            )
-
+            self._add_generated_resource(factory, generated_resource)
             return cast(T_Resource, generated_resource)
 
         if optional:
@@ -607,7 +657,9 @@ class Context:
             ``optional`` was ``False``
 
         """
-        self._ensure_state(ContextState.open, ContextState.closing)
+        # The state check is skipped in the common case of an open context
+        if self._state is not ContextState.open:
+            self._ensure_state(ContextState.open, ContextState.closing)
 
         # First check if there's already a matching resource in this context
         key = (type, name)
@@ -615,26 +667,12 @@ class Context:
             return cast(T_Resource, resource.value)
 
         # Next, check if there's a resource factory for this type
-        if key in self._resource_factories:
-            factory = self._resource_factories[key]
+        if (factory := self._resource_factories.get(key)) is not None:
             generated_resource = factory.callback()
             if isawaitable(generated_resource):
                 generated_resource = await generated_resource
 
-            container = ResourceContainer(
-                generated_resource,
-                factory.types,
-                factory.name,
-                factory.description,
-            )
-            for type_ in factory.types:
-                self._resources[(type_, factory.name)] = container
-
-            # Dispatch the resource_added event to notify any listeners
-            self.resource_added.dispatch(
-                ResourceEvent(factory.types, name, factory.description, False)
-            )
-
+            self._add_generated_resource(factory, generated_resource)
             return cast(T_Resource, generated_resource)
 
         if optional:
@@ -653,12 +691,14 @@ class Context:
         :return: a mapping of resource name to the resource
 
         """
-        # Collect all the matching resources from this context
-        return {
-            container.name: container.value
-            for container in self._resources.values()
-            if type in container.types
-        }
+        # Index the resources by type on first use, so that repeated lookups don't
+        # need to go through all the resources in the context
+        if (resources_by_type := self._resources_by_type) is None:
+            self._resources_by_type = resources_by_type = {}
+            for (type_, name), container in self._resources.items():
+                resources_by_type.setdefault(type_, {})[name] = container.value
+
+        return dict(resources_by_type.get(type, {}))
 
     async def start_background_task_factory(
         self, *, exception_handler: ExceptionHandler | None = None
@@ -796,16 +836,11 @@ def context_teardown(
     :return: an async function
     """
 
+    if not isasyncgenfunction(func):
+        raise TypeError(f"{callable_name(func)} must be an async generator function")
+
     @wraps(func)
     async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
-        async def teardown_callback(exception: BaseException | None) -> None:
-            try:
-                await generator.asend(exception)
-            except StopAsyncIteration:
-                pass
-            finally:
-                await generator.aclose()
-
         ctx = current_context()
         generator = func(*args, **kwargs)
         try:
@@ -816,14 +851,23 @@ def context_teardown(
             await generator.aclose()
             raise
         else:
-            ctx.add_teardown_callback(teardown_callback, True)
-
-    if not isasyncgenfunction(func):
-        raise TypeError(f"{callable_name(func)} must be an async generator function")
+            ctx.add_teardown_callback(partial(_finish_teardown, generator), True)
 
     return wrapper
 
 
+async def _finish_teardown(
+    generator: AsyncGenerator[None, BaseException | None],
+    exception: BaseException | None,
+) -> None:
+    try:
+        await generator.asend(exception)
+    except StopAsyncIteration:
+        pass
+    finally:
+        await generator.aclose()
+
+
 def current_context() -> Context:
     """
     Return the currently active context.
@@ -1087,9 +1131,7 @@ def inject(func: Callable[P, Any]) -> Callable[P, Any]:
         for key, dependency in injected_resources.items():
             dependency.cls = type_hints[key]
             origin = get_origin(type_hints[key])
-            if origin is Union or (
-                sys.version_info >= (3, 10) and origin is types.UnionType
-            ):
+            if origin is Union or (sys.version_info >= (3, 10) and origin is UnionType):
                 args = [
                     arg for arg in get_args(dependency.cls) if arg is not type(None)
                 ]
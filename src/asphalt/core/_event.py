@@ -113,6 +113,10 @@ class Signal(Generic[T_Event]):
         if not hasattr(self, "_instance"):
             raise UnboundSignal
 
+    def _has_listeners(self) -> bool:
+        # Lets dispatchers skip building events that nobody would receive
+        return bool(self._send_streams)
+
     @contextmanager
     def _subscribe(self, send: MemoryObjectSendStream[T_Event]) -> Generator[None]:
         self._check_is_bound_signal()
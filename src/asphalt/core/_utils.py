@@ -187,10 +187,10 @@ class PluginContainer:
         """
         if not isinstance(obj, str):
             return obj
+        elif (value := self._resolved.get(obj)) is not None:
+            return value
         elif ":" in obj:
             return resolve_reference(obj)
-        elif obj in self._resolved:
-            return self._resolved[obj]
 
         value = self._entrypoints.get(obj)
         if value is None:
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 import sys
+from collections import UserDict
+from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any, Callable, NoReturn
 from unittest.mock import Mock
@@ -19,6 +21,7 @@ from asphalt.core import (
     Context,
     add_resource,
     add_resource_factory,
+    current_context,
     get_resource,
     get_resource_nowait,
     get_resources,
@@ -138,6 +141,87 @@ class TestComplexComponent:
         assert isinstance(container["first"], DummyComponent)
         assert isinstance(container["second"], DummyComponent)
 
+    async def test_nested_creation_order(self, caplog: LogCaptureFixture) -> None:
+        caplog.set_level(logging.DEBUG, "asphalt.core")
+        async with Context():
+            await start_component(
+                Component,
+                {
+                    "components": {
+                        "dummy/a": {"components": {"dummy/x": None}},
+                        "dummy/b": None,
+                    }
+                },
+                timeout=None,
+            )
+
+        assert [
+            record.message
+            for record in caplog.records
+            if record.message.startswith("Creating")
+        ] == [
+            "Creating the root component (asphalt.core.Component)",
+            "Creating component 'dummy/a' (test_component.DummyComponent)",
+            "Creating component 'dummy/a.dummy/x' (test_component.DummyComponent)",
+            "Creating component 'dummy/b' (test_component.DummyComponent)",
+        ]
+
+    @pytest.mark.parametrize(
+        "declared, overrides, expected_kwargs",
+        [
+            pytest.param({"a": 1}, None, {"a": 1}, id="declared"),
+            pytest.param(None, {"b": 2}, {"b": 2}, id="overrides"),
+            pytest.param({"a": 1, "b": 1}, {"b": 2}, {"a": 1, "b": 2}, id="both"),
+        ],
+    )
+    async def test_child_component_config_merge(
+        self,
+        declared: dict[str, Any] | None,
+        overrides: dict[str, Any] | None,
+        expected_kwargs: dict[str, Any],
+    ) -> None:
+        container: dict[str, DummyComponent] = {}
+
+        class ContainerComponent(Component):
+            def __init__(self) -> None:
+                if declared is not None:
+                    self.add_component(
+                        "dummy", alias="dummy", container=container, **declared
+                    )
+
+        config: dict[str, Any] = {}
+        if overrides is not None:
+            # The container dict must not be merged with itself, so it's only passed
+            # here when the component doesn't declare the child
+            if declared is None:
+                overrides = {"alias": "dummy", "container": container, **overrides}
+
+            config["components"] = {"dummy": overrides}
+
+        async with Context():
+            await start_component(ContainerComponent, config)
+
+        assert container["dummy"].kwargs == expected_kwargs
+
+    async def test_child_components_from_non_dict_mapping(self) -> None:
+        container: dict[str, Component] = {}
+        async with Context():
+            await start_component(
+                Component,
+                UserDict(
+                    {
+                        "components": UserDict(
+                            {
+                                "dummy/a": {"alias": "a", "container": container},
+                                "dummy/b": {"alias": "b", "container": container},
+                            }
+                        )
+                    }
+                ),
+            )
+
+        assert sorted(container) == ["a", "b"]
+
     def test_add_duplicate_component(self) -> None:
         container = Component()
         container.add_component("dummy")
@@ -210,6 +294,13 @@ class TestCLIApplicationComponent:
         with pytest.raises(Exception, match="blah"):
             run_application(DummyCLIComponent, backend=anyio_backend_name)
 
+    def test_run_not_implemented(self, anyio_backend_name: str) -> None:
+        class DummyCLIComponent(CLIApplicationComponent):
+            pass
+
+        with pytest.raises(NotImplementedError):
+            run_application(DummyCLIComponent, backend=anyio_backend_name)
+
 
 @pytest.mark.parametrize("alias", ["", 6])
 def test_component_bad_alias(alias: object) -> None:
@@ -285,6 +376,21 @@ async def test_start_component_error_during_prepare() -> None:
     assert str(exc.value.__cause__) == "component fail"
 
 
+async def test_component_context_resource_maps_not_shared() -> None:
+    class ResourceComponent(Component):
+        async def start(self) -> None:
+            context = current_context()
+            assert context._resources == {}
+            assert context._resource_factories == {}
+            add_resource("foo")
+
+    async with Context() as root_context:
+        root_context.add_resource(1)
+        await start_component(ResourceComponent)
+        assert get_resource_nowait(str) == "foo"
+        assert root_context._resources.keys() == {(int, "default"), (str, "default")}
+
+
 async def test_start_component_no_context() -> None:
     with pytest.raises(
         RuntimeError, match=r"start_component\(\) requires an active Asphalt context"
@@ -292,6 +398,30 @@ async def test_start_component_no_context() -> None:
         await start_component(DummyComponent)
 
 
+@pytest.mark.parametrize("num_children", [1, 2])
+async def test_child_context_variables_isolated(num_children: int) -> None:
+    var = ContextVar[str]("var", default="unset")
+    seen_by_parent: list[str] = []
+
+    class ChildComponent(Component):
+        async def start(self) -> None:
+            var.set("child")
+
+    class ParentComponent(Component):
+        def __init__(self) -> None:
+            for i in range(num_children):
+                self.add_component(f"child{i}", ChildComponent)
+
+        async def start(self) -> None:
+            seen_by_parent.append(var.get())
+
+    async with Context():
+        await start_component(ParentComponent)
+        assert var.get() == "unset"
+
+    assert seen_by_parent == ["unset"]
+
+
 async def test_start_component_timeout() -> None:
     class StallingComponent(Component):
         async def start(self) -> None:
@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator, Callable
 from contextlib import AsyncExitStack, ExitStack
 from itertools import count
 from typing import Any, NoReturn, Optional, Union
+from unittest.mock import Mock
 
 import pytest
 from anyio import (
@@ -172,6 +173,30 @@ class TestContext:
         assert not event.is_factory
         assert context.get_resource_nowait(int, "foo") == 6
 
+    @pytest.mark.parametrize(
+        "subscribed", [False, True], ids=["no_subscriber", "subscriber"]
+    )
+    async def test_add_resource_event_only_built_for_subscribers(
+        self, context: Context, subscribed: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        event_class = Mock(wraps=ResourceEvent)
+        monkeypatch.setattr("asphalt.core._context.ResourceEvent", event_class)
+        async with AsyncExitStack() as stack:
+            if subscribed:
+                stream = await stack.enter_async_context(
+                    context.resource_added.stream_events()
+                )
+
+            context.add_resource(6, "foo")
+            if subscribed:
+                with fail_after(1):
+                    event = await stream.__anext__()
+
+                assert event.resource_types == (int,)
+                assert event.resource_name == "foo"
+
+        assert event_class.call_count == int(subscribed)
+
     async def test_add_resource_name_conflict(self, context: Context) -> None:
         """Test that adding a resource won't replace any existing resources."""
         context.add_resource(5, "foo")
@@ -344,6 +369,58 @@ class TestContext:
             assert subcontext.get_resource_nowait(int) == 2
             assert subcontext.get_resource_nowait(int) == 2
 
+    async def test_add_async_resource_factory_no_inherit(
+        self, context: Context
+    ) -> None:
+        """
+        Test that a subcontext gets its own version of a resource generated by an
+        async resource factory even if a parent context has one already.
+
+        """
+
+        async def factory() -> int:
+            return next(counter)
+
+        counter = count(1)
+        context.add_resource_factory(factory)
+
+        assert await context.get_resource(int) == 1
+        async with Context() as subcontext:
+            assert await subcontext.get_resource(int) == 2
+
+    async def test_no_instance_dict(self, context: Context) -> None:
+        with pytest.raises(AttributeError):
+            context.foo = 1  # type: ignore[attr-defined]
+
+    async def test_inherit_resources_added_later(self, context: Context) -> None:
+        """
+        Test that resources added to the parent context after a child context has been
+        created are visible to the subsequently created child contexts.
+
+        """
+        context.add_resource(1)
+        async with Context() as subcontext:
+            assert subcontext.get_resources(int) == {"default": 1}
+
+        context.add_resource(2, "other")
+        async with Context() as subcontext:
+            assert subcontext.get_resources(int) == {"default": 1, "other": 2}
+
+    async def test_generated_resource_not_inherited(self, context: Context) -> None:
+        """
+        Test that generating a resource keeps the inheritable resources cache, and that
+        child contexts generate their own instances.
+
+        """
+        counter = count(1)
+        context.add_resource_factory(lambda: next(counter), types=[int])
+        inheritable = context._get_inheritable_resources()
+        assert context.get_resource_nowait(int) == 1
+        assert context.get_resources(int) == {"default": 1}
+        assert context._get_inheritable_resources() is inheritable
+        async with Context() as subcontext:
+            assert subcontext.get_resource_nowait(int) == 2
+
     async def test_add_resource_return_type_single(self, context: Context) -> None:
         def factory() -> str:
             return "foo"
@@ -381,6 +458,18 @@ class TestContext:
             add_resource(1, "bar")
             assert get_resources(int) == {"bar": 1, "foo": 9}
 
+    async def test_get_resources_after_add(self, context: Context) -> None:
+        context.add_resource(9, "foo")
+        assert context.get_resources(int) == {"foo": 9}
+
+        context.add_resource(1, "bar", types=[int, float])
+        context.add_resource_factory(lambda: 3, "baz", types=[int])
+        assert context.get_resources(int) == {"foo": 9, "bar": 1}
+        assert context.get_resources(float) == {"bar": 1}
+
+        context.get_resource_nowait(int, "baz")
+        assert context.get_resources(int) == {"foo": 9, "bar": 1, "baz": 3}
+
     async def test_get_resource_nowait(self, context: Context) -> None:
         context.add_resource(1)
         assert context.get_resource_nowait(int) == 1